@@ -1,5 +1,6 @@
 # puzzle_experiment/config.py
 from pydantic import BaseModel, Field
+from defaults import CONFIG
 
 class SimulatedAnnealingConfig(BaseModel):
     target_iterations: int = Field(200000, description="How many iterations to run")
@@ -21,11 +22,5 @@ class PuzzleConfig(BaseModel):
     hill_climbing: HillClimbingConfig = HillClimbingConfig()
 
 # Create the instance
-# Users can edit values right here
-config = PuzzleConfig(
-    time_limit=1050, # User changed this
-    beam_width=100,
-    simulated_annealing=SimulatedAnnealingConfig(
-        target_iterations=500000 # User increased this
-    )
-)
\ No newline at end of file
+# Values live in defaults.py (plain data, no pydantic import needed to read them)
+config = PuzzleConfig(**CONFIG)
@@ -0,0 +1,34 @@
+# puzzle_experiment/defaults.py
+# Plain experiment values: users edit this file.
+# Kept free of pydantic so `main.py --no-validate` can start without importing it;
+# config.py and puzzle_setup.py build their validated models from these dicts.
+
+# --- Algorithm parameters (validated by config.PuzzleConfig) ---
+CONFIG = {
+    "time_limit": 1050,             # seconds (user changed this)
+    "beam_width": 100,              # for Beam Search
+    "simulated_annealing": {
+        "target_iterations": 500000,  # user increased this
+        "start_temp": 100.0,
+        "min_temp": 0.5,
+    },
+    "hill_climbing": {
+        "max_restarts": 1000,
+        "min_scramble": 5,
+        "max_scramble": 20,
+    },
+}
+
+# --- Puzzle definition (validated by puzzle_setup.PuzzleSetup) ---
+PUZZLE = {
+    "start_state": [
+        [7, 2, 4],
+        [5, 0, 6],
+        [8, 3, 1]
+    ],
+    "goal_state": [
+        [0, 1, 2],
+        [3, 4, 5],
+        [6, 7, 8]
+    ],
+}
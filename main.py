@@ -1,34 +1,180 @@
 # puzzle_experiment/main.py
+import time
+
+# Measure startup from the very first line, before any other import
+_T0 = time.perf_counter()
+
+import argparse
+import copy
+import importlib
+import json
 import sys
-import os
-
-# 1. Setup path to import local modules from the 'lib' folder
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-# 2. IMPORT CONFIG & SETUP OBJECTS DIRECTLY
-# (Do not use json.load anymore)
-from config import config
-from puzzle_setup import puzzle_setup
-
-# 3. Import Logic
-from lib.utils import is_solvable
-from lib.heuristics import h_manhattan, h_misplaced
-from lib.solvers import (
-    solve_bfs, solve_astar, solve_beam_search, solve_rbfs, 
-    solve_hill_climbing, solve_random_restart_hill_climbing, 
-    solve_simulated_annealing, solve_iddfs
-)
-
-def run_pipeline():
+from types import SimpleNamespace
+
+from defaults import CONFIG, PUZZLE
+
+# 1. Solver registry
+# Everything is stored by NAME (module, function, heuristic) and resolved with
+# importlib only for the solvers that were actually requested. Listing or
+# selecting solvers therefore never imports the solver code.
+#   key: (label, solver function in lib.solvers, heuristic in lib.heuristics or None)
+SOLVERS = {
+    "bfs":              ("BFS", "solve_bfs", None),
+    "iddfs":            ("IDDFS", "solve_iddfs", None),
+    "astar-misplaced":  ("A* (Misplaced)", "solve_astar", "h_misplaced"),
+    "astar-manhattan":  ("A* (Manhattan)", "solve_astar", "h_manhattan"),
+    "beam-manhattan":   ("Beam (k={k}, Manh)", "solve_beam_search", "h_manhattan"),
+    "beam-misplaced":   ("Beam (k={k}, Misplaced)", "solve_beam_search", "h_misplaced"),
+    "rbfs-misplaced":   ("RBFS (Misplaced)", "solve_rbfs", "h_misplaced"),
+    "rbfs-manhattan":   ("RBFS (Manhattan)", "solve_rbfs", "h_manhattan"),
+    "hill":             ("Hill Climbing", "solve_hill_climbing", "h_manhattan"),
+    "hill-restart":     ("Hill Climb (Rnd Restart)", "solve_random_restart_hill_climbing", "h_manhattan"),
+    "annealing":        ("Sim. Annealing", "solve_simulated_annealing", "h_manhattan"),
+}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="N-Puzzle Solver Pipeline")
+    parser.add_argument("-s", "--solver", dest="solvers", action="append", choices=list(SOLVERS),
+                        metavar="NAME", help="Solver to run (repeatable). Default: all. See --list.")
+    parser.add_argument("-i", "--instance", metavar="FILE",
+                        help="JSON file with 'start_state' and 'goal_state'. Default: puzzle_setup.py")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE",
+                        help="Override a config value, e.g. time_limit=10 or simulated_annealing.start_temp=50")
+    parser.add_argument("--no-validate", action="store_true",
+                        help="Trust the instance file and overrides (skip Pydantic validation)")
+    parser.add_argument("--list", action="store_true", help="List available solvers and exit")
+    return parser, parser.parse_args(argv)
+
+def parse_overrides(items):
+    # "a.b=1" -> {"a": {"b": 1}}; values are read as JSON, falling back to plain strings
+    overrides = {}
+    for item in items:
+        key, sep, raw = item.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Invalid override '{item}', expected KEY=VALUE")
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw
+        *parents, leaf = key.split(".")
+        target = overrides
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = value
+    return overrides
+
+def _check_keys(defaults, updates, prefix=""):
+    # Check against the plain defaults (which list every field), so typos are caught
+    # without importing pydantic; pydantic itself would silently ignore unknown keys
+    for key, value in updates.items():
+        name = f"{prefix}{key}"
+        if key not in defaults:
+            raise ValueError(f"Unknown config key '{name}'. Valid keys: {', '.join(defaults)}")
+        section = defaults[key] if isinstance(defaults[key], dict) else None
+        if isinstance(value, dict):
+            if section is None:
+                raise ValueError(f"Config key '{name}' has no nested fields")
+            _check_keys(section, value, f"{name}.")
+        elif section is not None:
+            raise ValueError(f"Config key '{name}' is a section; set one of its fields, e.g. {name}.{next(iter(section))}=...")
+
+def _merge(data, updates):
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(data.get(key), dict):
+            _merge(data[key], value)
+        else:
+            data[key] = value
+    return data
+
+def _to_namespace(data):
+    # Attribute access like the Pydantic models, for the unvalidated fast path
+    return SimpleNamespace(**{k: _to_namespace(v) if isinstance(v, dict) else v for k, v in data.items()})
+
+def load_config(overrides, validate=True):
+    _check_keys(CONFIG, overrides)
+    if not validate:
+        return _to_namespace(_merge(copy.deepcopy(CONFIG), overrides))
+
+    # Imported here so pydantic is only paid for on runs that validate
+    from config import config, PuzzleConfig
+    if not overrides:
+        # The default instance was already validated when config.py was imported
+        return config
+    return PuzzleConfig.model_validate(_merge(copy.deepcopy(CONFIG), overrides))
+
+def load_puzzle(instance_path=None, validate=True):
+    if instance_path is None:
+        if not validate:
+            return SimpleNamespace(**PUZZLE)
+        from puzzle_setup import puzzle_setup
+        return puzzle_setup
+
+    with open(instance_path) as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{instance_path}: invalid JSON ({e})") from e
+    missing = [key for key in ("start_state", "goal_state") if not isinstance(data, dict) or key not in data]
+    if missing:
+        raise ValueError(f"{instance_path}: missing required key(s): {', '.join(missing)}")
+    if not validate:
+        return SimpleNamespace(start_state=data["start_state"], goal_state=data["goal_state"])
+
+    from puzzle_setup import PuzzleSetup
+    return PuzzleSetup.model_validate(data)
+
+def _one_line(error):
+    # A ValidationError can only exist if pydantic was already imported
+    pydantic = sys.modules.get("pydantic")
+    if pydantic is not None and isinstance(error, pydantic.ValidationError):
+        return "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in error.errors())
+    return str(error)
+
+def build_solvers(names, start_state, goal_state, goal_map, config):
+    # Resolve solver/heuristic names lazily, only for what was requested
+    solvers_mod = importlib.import_module("lib.solvers")
+    heuristics_mod = None
+
+    solvers = []
+    for key in names:
+        label, func_name, h_name = SOLVERS[key]
+        func = getattr(solvers_mod, func_name)
+        name = label.format(k=config.beam_width)
+        if h_name is None:
+            run = lambda func=func: func(start_state, goal_state, goal_map, config)
+        else:
+            if heuristics_mod is None:
+                heuristics_mod = importlib.import_module("lib.heuristics")
+            h_func = getattr(heuristics_mod, h_name)
+            run = lambda func=func, h_func=h_func: func(start_state, goal_state, goal_map, h_func, config)
+        solvers.append((name, run))
+    return solvers
+
+def run_pipeline(argv=None):
+    parser, args = parse_args(argv)
+
+    if args.list:
+        for key, (label, _, _) in SOLVERS.items():
+            print(f"{key:<18} {label.format(k='?')}")
+        return
+
     print("\n--- N-Puzzle Solver Pipeline ---")
-    
-    # --- CHANGE: Access via Dot Notation ---
-    # config is now an Object, not a Dictionary
+
+    # 2. Load config & puzzle (validated unless --no-validate)
+    validate = not args.no_validate
+    try:
+        config = load_config(parse_overrides(args.overrides), validate)
+        puzzle = load_puzzle(args.instance, validate)
+    except (ValueError, OSError) as e:
+        # json.JSONDecodeError and pydantic.ValidationError are both ValueError subclasses
+        parser.error(_one_line(e))
+
     print(f"Loaded Configuration: Time Limit={config.time_limit}s")
-    
-    start_state = puzzle_setup.start_state
-    goal_state = puzzle_setup.goal_state
 
+    start_state = puzzle.start_state
+    goal_state = puzzle.goal_state
+
+    from lib.utils import is_solvable
     if not is_solvable(start_state, goal_state):
         print("Error: Puzzle is Unsolvable!")
         return
@@ -40,31 +186,21 @@ def run_pipeline():
         for c in range(n):
             goal_map[goal_state[r][c]] = (r, c)
 
-    # 4. Define Solvers
-    # Pass the 'config' OBJECT to solvers
-    solvers = [
-        ("BFS", lambda: solve_bfs(start_state, goal_state, goal_map, config)),
-        ("IDDFS", lambda: solve_iddfs(start_state, goal_state, goal_map, config)),
-        ("A* (Misplaced)", lambda: solve_astar(start_state, goal_state, goal_map, h_misplaced, config)),
-        ("A* (Manhattan)", lambda: solve_astar(start_state, goal_state, goal_map, h_manhattan, config)),
-        (f"Beam (k={config.beam_width}, Manh)", lambda: solve_beam_search(start_state, goal_state, goal_map, h_manhattan, config)),
-        (f"Beam (k={config.beam_width}, Misplaced)", lambda: solve_beam_search(start_state, goal_state, goal_map, h_misplaced, config)),
-        ("RBFS (Misplaced)", lambda: solve_rbfs(start_state, goal_state, goal_map, h_misplaced, config)),
-        ("RBFS (Manhattan)", lambda: solve_rbfs(start_state, goal_state, goal_map, h_manhattan, config)),
-        ("Hill Climbing", lambda: solve_hill_climbing(start_state, goal_state, goal_map, h_manhattan, config)),
-        ("Hill Climb (Rnd Restart)", lambda: solve_random_restart_hill_climbing(start_state, goal_state, goal_map, h_manhattan, config)),
-        ("Sim. Annealing", lambda: solve_simulated_annealing(start_state, goal_state, goal_map, h_manhattan, config))
-    ]
-
-    # 5. Run & Print
+    # 3. Resolve the requested solvers
+    names = args.solvers or list(SOLVERS)
+    solvers = build_solvers(names, start_state, goal_state, goal_map, config)
+
+    print(f"Startup Time: {time.perf_counter() - _T0:.4f}s (imports, config & setup)")
+
+    # 4. Run & Print
     print(f"\n{'-'*120}")
     print(f"{'Algorithm':<22} | {'Status':<10} | {'Moves':<5} | {'Nodes Exp.':<10} | {'Max Mem':<10} | {'Final h':<8} | {'Time (s)':<10}")
     print(f"{'-'*120}")
 
     for name, func in solvers:
         path, nodes, max_mem, runtime, final_h = func()
-        
-        if isinstance(runtime, str): 
+
+        if isinstance(runtime, str):
             status = "FAILED" if runtime != "> Limit" else "TIMEOUT"
             if runtime == "Local Max": status = "STUCK"
             moves = "-"
@@ -77,10 +213,10 @@ def run_pipeline():
             status = "SOLVED"
             moves = len(path)
             time_str = f"{runtime:.4f}"
-            
+
         print(f"{name:<22} | {status:<10} | {str(moves):<5} | {str(nodes):<10} | {str(max_mem):<10} | {str(final_h):<8} | {time_str:<10}")
 
     print(f"{'-'*120}")
 
 if __name__ == "__main__":
-    run_pipeline()
\ No newline at end of file
+    run_pipeline()
@@ -1,6 +1,7 @@
 # puzzle_experiment/puzzle_setup.py
 from pydantic import BaseModel, field_validator, ValidationInfo
 from typing import List
+from defaults import PUZZLE
 
 class PuzzleSetup(BaseModel):
     start_state: List[List[int]]
@@ -34,16 +35,5 @@ class PuzzleSetup(BaseModel):
 
         return board
 
-# --- INSTANCE: User edits this part ---
-puzzle_setup = PuzzleSetup(
-    start_state=[
-        [7, 2, 4],
-        [5, 0, 6],
-        [8, 3, 1]
-    ],
-    goal_state=[
-        [0, 1, 2],
-        [3, 4, 5],
-        [6, 7, 8]
-    ]
-)
\ No newline at end of file
+# --- INSTANCE: values live in defaults.py ---
+puzzle_setup = PuzzleSetup(**PUZZLE)
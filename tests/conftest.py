@@ -0,0 +1,6 @@
+# puzzle_experiment/tests/conftest.py
+import sys
+import os
+
+# Make the top-level modules (main, config, puzzle_setup, lib) importable from tests
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
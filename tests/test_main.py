@@ -0,0 +1,127 @@
+# puzzle_experiment/tests/test_main.py
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import main
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --- parse_overrides ---
+
+def test_parse_overrides_json_and_plain_values():
+    overrides = main.parse_overrides(["time_limit=10", "beam_width=2.5", "name=abc", "flag=true"])
+    assert overrides == {"time_limit": 10, "beam_width": 2.5, "name": "abc", "flag": True}
+
+def test_parse_overrides_nested_keys():
+    overrides = main.parse_overrides([
+        "simulated_annealing.start_temp=50",
+        "simulated_annealing.min_temp=0.1",
+        "hill_climbing.max_restarts=3",
+    ])
+    assert overrides == {
+        "simulated_annealing": {"start_temp": 50, "min_temp": 0.1},
+        "hill_climbing": {"max_restarts": 3},
+    }
+
+def test_parse_overrides_rejects_missing_equals():
+    with pytest.raises(ValueError):
+        main.parse_overrides(["time_limit"])
+
+# --- load_config ---
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_load_config_applies_overrides(validate):
+    overrides = main.parse_overrides(["time_limit=7", "simulated_annealing.start_temp=50"])
+    config = main.load_config(overrides, validate)
+    assert config.time_limit == 7
+    assert config.simulated_annealing.start_temp == 50
+    # Untouched nested values keep their defaults
+    assert config.simulated_annealing.target_iterations == 500000
+
+@pytest.mark.parametrize("validate", [True, False])
+@pytest.mark.parametrize("item", ["time_limt=10", "simulated_annealing.start_tmp=5", "time_limit.x=1", "hill_climbing=5"])
+def test_load_config_rejects_unknown_keys(item, validate):
+    with pytest.raises(ValueError):
+        main.load_config(main.parse_overrides([item]), validate)
+
+def test_defaults_cover_every_config_field():
+    # The unknown-key check reads defaults.CONFIG, so it must list every model field
+    from config import PuzzleConfig
+
+    def field_tree(model_cls):
+        return {name: field_tree(f.annotation) if hasattr(f.annotation, "model_fields") else None
+                for name, f in model_cls.model_fields.items()}
+
+    def key_tree(data):
+        return {k: key_tree(v) if isinstance(v, dict) else None for k, v in data.items()}
+
+    assert key_tree(main.CONFIG) == field_tree(PuzzleConfig)
+
+def test_load_config_validates_values():
+    from pydantic import ValidationError
+    with pytest.raises(ValidationError):
+        main.load_config({"beam_width": 0})
+
+# --- load_puzzle ---
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_load_puzzle_requires_both_states(tmp_path, validate):
+    path = tmp_path / "instance.json"
+    path.write_text(json.dumps({"start_state": [[1, 0], [2, 3]]}))
+    with pytest.raises(ValueError, match="goal_state"):
+        main.load_puzzle(str(path), validate)
+
+# --- build_solvers ---
+
+def test_build_solvers_resolves_requested_names():
+    config = main.load_config({"time_limit": 5, "beam_width": 10})
+    start = [[1, 2, 0], [3, 4, 5], [6, 7, 8]]
+    goal = [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+    goal_map = {goal[r][c]: (r, c) for r in range(3) for c in range(3)}
+
+    solvers = main.build_solvers(["bfs", "beam-misplaced"], start, goal, goal_map, config)
+
+    assert [name for name, _ in solvers] == ["BFS", "Beam (k=10, Misplaced)"]
+    for _, run in solvers:
+        path = run()[0]
+        assert path == ["Left", "Left"]
+
+# --- CLI ---
+
+def _run_cli(*args):
+    return subprocess.run([sys.executable, os.path.join(ROOT, "main.py"), *args],
+                          capture_output=True, text=True)
+
+def test_list_does_not_import_pydantic():
+    code = "import sys, main; main.run_pipeline(['--list']); assert 'pydantic' not in sys.modules"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert "astar-manhattan" in result.stdout
+
+def test_no_validate_does_not_import_pydantic(tmp_path):
+    path = tmp_path / "instance.json"
+    path.write_text(json.dumps({"start_state": [[1, 2, 0], [3, 4, 5], [6, 7, 8]],
+                                "goal_state": [[0, 1, 2], [3, 4, 5], [6, 7, 8]]}))
+    code = ("import sys, main; "
+            f"main.run_pipeline(['-i', {str(path)!r}, '-s', 'bfs', '--no-validate', '--set', 'time_limit=5']); "
+            "assert 'pydantic' not in sys.modules")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert "SOLVED" in result.stdout
+
+@pytest.mark.parametrize("args", [
+    ["--set", "foo"],
+    ["--set", "time_limt=10"],
+    ["--set", "time_limit=abc"],
+    ["--set", "beam_width=0"],
+    ["-i", "does-not-exist.json"],
+])
+def test_bad_input_exits_cleanly(args):
+    result = _run_cli(*args)
+    assert result.returncode == 2
+    assert "Traceback" not in result.stderr
+    assert "error:" in result.stderr